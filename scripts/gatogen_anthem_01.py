@@ -9,8 +9,11 @@ for non-realtime rendering to work.
 from __future__ import annotations
 
 import argparse
+import functools
+import itertools
 import math
 import random
+from collections.abc import Sequence
 from pathlib import Path
 
 import supriya
@@ -53,11 +56,32 @@ from supriya.ugens import (
     WhiteNoise,
 )
 
+PROG_ROOTS = (57, 53, 60, 55)
+ARP_STEPS = (0, 7, 12, 7, 0, 3, 7, 10)
+LEAD_MELODY = (12, 15, 19, 17, 12, 10, 7, 10)
+PLUCK_INTERVALS = (0, 3, 7, 10, 12, 14)
+PAD_DETUNE = (1.0, 1.008, 0.989, 1.015)
+# Divisible by 4 for sixteenths and by 5 so that 12s (26.4 beats at 132 BPM)
+# still lands exactly on a tick.
+TICKS_PER_BEAT = 20
 
+
+@functools.lru_cache(maxsize=None)
 def midi_to_hz(note: float) -> float:
     return 440.0 * (2.0 ** ((note - 69.0) / 12.0))
 
 
+def write_out(out, sig, amp, rev, dly):
+    # Dry, reverb-send and delay-send pairs go to six contiguous buses starting
+    # at ``out`` with one Out.ar. A mono signal is scaled once per pair and
+    # written to both of its sides.
+    if isinstance(sig, Sequence) and len(sig) == 2:
+        source = [channel * gain for gain in (amp, rev, dly) for channel in sig]
+    else:
+        source = [scaled for gain in (amp, rev, dly) for scaled in [sig * gain] * 2]
+    Out.ar(bus=out, source=source)
+
+
 @synthdef()
 def master_out(in_=0, out=0, gain=0.85):
     sig = In.ar(bus=in_, channel_count=2)
@@ -92,7 +116,7 @@ def delay(in_=0, out=0, time=0.33, decay=3.2, mix=0.22):
 
 
 @synthdef()
-def kick(out=0, send_rev=0, send_del=0, amp=0.9):
+def kick(out=0, amp=0.9):
     env = EnvGen.kr(Envelope.percussive(0.001, 0.28, curve=-6), done_action=2)
     fenv = EnvGen.kr(Envelope([82, 34, 28], [0.02, 0.18], curve=-8))
     sig = SinOsc.ar(fenv) * env
@@ -100,14 +124,11 @@ def kick(out=0, send_rev=0, send_del=0, amp=0.9):
         Envelope.percussive(0.001, 0.03), done_action=0
     )
     sig = (sig + click).tanh()
-    sig = [sig, sig]
-    Out.ar(bus=out, source=sig * amp)
-    Out.ar(bus=send_rev, source=sig * amp * 0.03)
-    Out.ar(bus=send_del, source=sig * amp * 0.02)
+    write_out(out, sig, amp, amp * 0.03, amp * 0.02)
 
 
 @synthdef()
-def snare(out=0, send_rev=0, send_del=0, amp=0.35):
+def snare(out=0, amp=0.35):
     env = EnvGen.kr(Envelope.percussive(0.002, 0.22, curve=-4), done_action=2)
     nenv = EnvGen.kr(Envelope.percussive(0.001, 0.16, curve=-2), done_action=0)
     body = SinOsc.ar(190, 0, 0.35) + SinOsc.ar(330, 0, 0.18)
@@ -115,28 +136,22 @@ def snare(out=0, send_rev=0, send_del=0, amp=0.35):
     sig = (body * env) + noise
     sig = HPF.ar(sig, 120)
     sig = sig.tanh()
-    sig = [sig, sig]
-    Out.ar(bus=out, source=sig * amp)
-    Out.ar(bus=send_rev, source=sig * amp * 0.22)
-    Out.ar(bus=send_del, source=sig * amp * 0.06)
+    write_out(out, sig, amp, amp * 0.22, amp * 0.06)
 
 
 @synthdef()
-def hat(out=0, send_rev=0, send_del=0, amp=0.14, bright=0.6):
+def hat(out=0, amp=0.14, bright=0.6):
     env = EnvGen.kr(Envelope.percussive(0.001, 0.06, curve=-6), done_action=2)
     sig = WhiteNoise.ar(1) * env
     hp = bright.linexp(0, 1, 6000, 12000)
     sig = HPF.ar(sig, hp)
     sig = BPF.ar(sig, hp * 1.1, 0.6)
     sig = sig.tanh()
-    sig = [sig, sig]
-    Out.ar(bus=out, source=sig * amp)
-    Out.ar(bus=send_rev, source=sig * amp * 0.06)
-    Out.ar(bus=send_del, source=sig * amp * 0.12)
+    write_out(out, sig, amp, amp * 0.06, amp * 0.12)
 
 
 @synthdef()
-def bass(out=0, send_rev=0, send_del=0, amp=0.22, freq=55, sustain=0.12, bright=0.2, drive=1.4):
+def bass(out=0, amp=0.22, freq=55, sustain=0.12, bright=0.2, drive=1.4):
     env = EnvGen.kr(
         Envelope.percussive(0.002, sustain.max(0.03), curve=-5), done_action=2
     )
@@ -148,19 +163,16 @@ def bass(out=0, send_rev=0, send_del=0, amp=0.22, freq=55, sustain=0.12, bright=
     sig = RLPF.ar(sig, cut, 0.12 + (bright * 0.25))
     sig = (sig * drive).tanh()
     sig = Pan2.ar(sig, LFNoise1.kr(0.25).range(-0.05, 0.05))
-    Out.ar(bus=out, source=sig * amp)
-    Out.ar(bus=send_rev, source=sig * amp * 0.05)
-    Out.ar(bus=send_del, source=sig * amp * 0.03)
+    write_out(out, sig, amp, amp * 0.05, amp * 0.03)
 
 
 @synthdef()
-def pad(out=0, send_rev=0, send_del=0, amp=0.10, freq=220, sustain=6, bright=0.15, motion=0.35):
+def pad(out=0, amp=0.10, freq=220, sustain=6, bright=0.15, motion=0.35):
     env = EnvGen.kr(
         Envelope.linen(0.6, sustain.max(0.5), 1.2, curve=-3), done_action=2
     )
-    det = [0.0, 0.008, -0.011, 0.015]
     wob = SinOsc.kr(0.08 + (motion * 0.18)).range(0.98, 1.02)
-    osc = Mix.new(VarSaw.ar(freq * wob * (1 + det), 0, 0.35)) * 0.35
+    osc = Mix.new(VarSaw.ar(freq * wob * PAD_DETUNE, 0, 0.35)) * 0.35
     noise = PinkNoise.ar(0.06) * (0.4 + (motion * 0.6))
     sig = (osc + noise) * env
     cut = bright.linexp(0, 1, 350, 6500) * (
@@ -170,13 +182,11 @@ def pad(out=0, send_rev=0, send_del=0, amp=0.10, freq=220, sustain=6, bright=0.1
     sig = AllpassN.ar(sig, 0.2, [Rand.ir(0.02, 0.12), Rand.ir(0.02, 0.12)], 2)
     sig = Splay.ar([sig, sig], 0.5, 1).sum()
     sig = LeakDC.ar(sig).tanh()
-    Out.ar(bus=out, source=sig * amp)
-    Out.ar(bus=send_rev, source=sig * amp * 0.45)
-    Out.ar(bus=send_del, source=sig * amp * 0.10)
+    write_out(out, sig, amp, amp * 0.45, amp * 0.10)
 
 
 @synthdef()
-def pluck(out=0, send_rev=0, send_del=0, amp=0.12, freq=440, sustain=0.25, bright=0.5):
+def pluck(out=0, amp=0.12, freq=440, sustain=0.25, bright=0.5):
     trig = Impulse.ar(0)
     src = PinkNoise.ar(0.55)
     sig = Pluck.ar(src, trig, 0.2, (1 / freq).clip(0.002, 0.2), sustain.max(0.05) * 2.0, 0.35)
@@ -187,13 +197,11 @@ def pluck(out=0, send_rev=0, send_del=0, amp=0.12, freq=440, sustain=0.25, brigh
     sig = RLPF.ar(sig, cut, 0.25)
     sig = Pan2.ar(sig, LFNoise1.kr(0.9).range(-0.7, 0.7))
     sig = sig.tanh()
-    Out.ar(bus=out, source=sig * amp * env)
-    Out.ar(bus=send_rev, source=sig * amp * 0.30 * env)
-    Out.ar(bus=send_del, source=sig * amp * 0.35 * env)
+    write_out(out, sig * env, amp, amp * 0.30, amp * 0.35)
 
 
 @synthdef()
-def lead(out=0, send_rev=0, send_del=0, amp=0.11, freq=440, sustain=0.35, bright=0.8, bite=0.4):
+def lead(out=0, amp=0.11, freq=440, sustain=0.35, bright=0.8, bite=0.4):
     env = EnvGen.kr(
         Envelope.percussive(0.005, sustain.max(0.06), curve=-4), done_action=2
     )
@@ -204,13 +212,11 @@ def lead(out=0, send_rev=0, send_del=0, amp=0.11, freq=440, sustain=0.35, bright
     sig = sig + (BPF.ar(WhiteNoise.ar(0.04 + (bite * 0.06)), cut * 0.8, 0.3) * env)
     sig = (sig * (1.4 + bite)).tanh()
     sig = Pan2.ar(sig, SinOsc.kr(0.12).range(-0.4, 0.4))
-    Out.ar(bus=out, source=sig * amp)
-    Out.ar(bus=send_rev, source=sig * amp * 0.35)
-    Out.ar(bus=send_del, source=sig * amp * 0.40)
+    write_out(out, sig, amp, amp * 0.35, amp * 0.40)
 
 
 @synthdef()
-def glitch_hit(out=0, send_rev=0, send_del=0, amp=0.10, freq=900, dur=0.07, crush=0.55, pan=0):
+def glitch_hit(out=0, amp=0.10, freq=900, dur=0.07, crush=0.55, pan=0):
     env = EnvGen.kr(Envelope.percussive(0.001, dur.max(0.02), curve=-7), done_action=2)
     sig = (SinOsc.ar(freq * [1, 1.007]).sum() * 0.5) + (LFSaw.ar(freq * 0.5, 0, 0.25))
     sig = sig + (WhiteNoise.ar(0.28) * env)
@@ -221,13 +227,11 @@ def glitch_hit(out=0, send_rev=0, send_del=0, amp=0.10, freq=900, dur=0.07, crus
     sig = Latch.ar(sig, Impulse.ar(rate))
     sig = (sig * (2**8)).round() / (2**8)
     sig = Pan2.ar(sig, pan)
-    Out.ar(bus=out, source=sig * amp)
-    Out.ar(bus=send_rev, source=sig * amp * 0.15)
-    Out.ar(bus=send_del, source=sig * amp * 0.55)
+    write_out(out, sig, amp, amp * 0.15, amp * 0.55)
 
 
 @synthdef()
-def modem(out=0, send_rev=0, send_del=0, amp=0.10, dur=0.5, pan=0):
+def modem(out=0, amp=0.10, dur=0.5, pan=0):
     env = EnvGen.kr(Envelope.percussive(0.001, dur.max(0.05), curve=-3), done_action=2)
     rate = LFNoise0.kr(14).range(5, 16)
     freq = Demand.kr(Impulse.kr(rate), 0, Dxrand([260, 390, 520, 780, 1040, 1320, 1560, 2080], math.inf))
@@ -235,13 +239,11 @@ def modem(out=0, send_rev=0, send_del=0, amp=0.10, dur=0.5, pan=0):
     sig = sig + (BPF.ar(WhiteNoise.ar(0.18), freq * 2, 0.18) * env)
     sig = (sig * 2.0).tanh()
     sig = Pan2.ar(sig, pan)
-    Out.ar(bus=out, source=sig * amp)
-    Out.ar(bus=send_rev, source=sig * amp * 0.30)
-    Out.ar(bus=send_del, source=sig * amp * 0.45)
+    write_out(out, sig, amp, amp * 0.30, amp * 0.45)
 
 
 @synthdef()
-def riser(out=0, send_rev=0, send_del=0, amp=0.16, dur=4.0):
+def riser(out=0, amp=0.16, dur=4.0):
     env = EnvGen.kr(Envelope.linen(0.05, dur.max(0.2), 0.2, curve=-2), done_action=2)
     fenv = EnvGen.kr(Envelope([300, 12000], [dur.max(0.2)], curve=3))
     sig = WhiteNoise.ar(1)
@@ -249,13 +251,11 @@ def riser(out=0, send_rev=0, send_del=0, amp=0.16, dur=4.0):
     sig = sig + (SinOsc.ar(fenv * 0.25, 0, 0.25))
     sig = (sig * 1.8).tanh()
     sig = Pan2.ar(sig, SinOsc.kr(0.3).range(-0.6, 0.6))
-    Out.ar(bus=out, source=sig * amp * env)
-    Out.ar(bus=send_rev, source=sig * amp * 0.55 * env)
-    Out.ar(bus=send_del, source=sig * amp * 0.30 * env)
+    write_out(out, sig * env, amp, amp * 0.55, amp * 0.30)
 
 
 @synthdef()
-def crash(out=0, send_rev=0, send_del=0, amp=0.55):
+def crash(out=0, amp=0.55):
     env = EnvGen.kr(Envelope.percussive(0.001, 1.4, curve=-2), done_action=2)
     fenv = EnvGen.kr(Envelope([12000, 250, 80], [0.06, 1.2], curve=-6))
     sig = WhiteNoise.ar(1) + PinkNoise.ar(0.7)
@@ -263,42 +263,45 @@ def crash(out=0, send_rev=0, send_del=0, amp=0.55):
     sig = sig + (SinOsc.ar(fenv * 0.25, 0, 0.3))
     sig = HPF.ar(sig, 35)
     sig = (sig * 4.0).tanh()
-    sig = [sig, sig]
-    Out.ar(bus=out, source=sig * amp * env)
-    Out.ar(bus=send_rev, source=sig * amp * 0.65 * env)
-    Out.ar(bus=send_del, source=sig * amp * 0.20 * env)
+    write_out(out, sig * env, amp, amp * 0.65, amp * 0.20)
 
 
 @synthdef()
-def swarm(out=0, send_rev=0, send_del=0, amp=0.08, base=110, life=10, chaos=0.6):
+def swarm(out=0, amp=0.08, base=110, life=10, chaos=0.6):
     env = EnvGen.kr(Envelope.linen(0.5, life.max(0.5), 2.0, curve=-3), done_action=2)
     spread = chaos.linlin(0, 1, 0.2, 0.95)
+    drift_rate = 0.04 + (chaos * 0.15)
+    depth = chaos * 0.02
+    rq = 0.06 + (chaos * 0.55)
+    # Voices i, i + 4 and i + 8 share modulator i at depth 1, -1 and 0.5.
+    drifts = [LFNoise1.kr(drift_rate).range(-0.008, 0.008) for _ in range(4)]
+    widths = [LFNoise2.kr(0.25).range(-0.42, 0.42) for _ in range(4)]
+    sweeps = [LFNoise1.kr(0.1).range(-1, 1) * chaos for _ in range(4)]
     voices = []
     for i in range(12):
         det = ((i - 6) / 12) * 0.015
-        freq = base * (1 + det + LFNoise1.kr(0.04 + (chaos * 0.15)).range(-0.008, 0.008))
-        fm = SinOsc.ar(freq * (1.0 + (i * 0.03)), 0, freq * chaos * 0.02)
-        osc = Pulse.ar(freq + fm, LFNoise2.kr(0.25).range(0.08, 0.92), 0.35)
+        bank, scale = i % 4, (1, -1, 0.5)[i // 4]
+        freq = base * (1 + det + (drifts[bank] * scale))
+        fm = SinOsc.ar(freq * (1.0 + (i * 0.03)), 0, freq * depth)
+        osc = Pulse.ar(freq + fm, 0.5 + (widths[bank] * scale), 0.35)
         ring = osc * SinOsc.ar((freq * 2) + (fm * 1.5), 0, 0.5)
-        noise = BPF.ar(WhiteNoise.ar(0.02 * chaos), freq * 4, 0.25)
+        noise = BPF.ar(WhiteNoise.ar(depth), freq * 4, 0.25)
         voices.append(
             RLPF.ar(
                 ring + noise,
-                (freq * (3.5 + LFNoise1.kr(0.1).range(-1, 1) * chaos)).clip(160, 9000),
-                0.06 + (chaos * 0.55),
+                (freq * (3.5 + (sweeps[bank] * scale))).clip(160, 9000),
+                rq,
             )
         )
     sig = Splay.ar(voices, spread, 1).sum()
     sig = LeakDC.ar(sig)
     sig = (sig * (1.6 + chaos)).tanh()
     sig = sig * env
-    Out.ar(bus=out, source=sig * amp)
-    Out.ar(bus=send_rev, source=sig * amp * 0.55)
-    Out.ar(bus=send_del, source=sig * amp * 0.25)
+    write_out(out, sig, amp, amp * 0.55, amp * 0.25)
 
 
 @synthdef()
-def patchlet(out=0, send_rev=0, send_del=0, amp=0.03, freq=110, life=6, chaos=0.5, pan=0):
+def patchlet(out=0, amp=0.03, freq=110, life=6, chaos=0.5, pan=0):
     env = EnvGen.kr(Envelope.linen(0.01, life.max(0.2), 0.8, curve=-3), done_action=2)
     mod_a = LFNoise1.kr(0.15 + (chaos * 1.8)).range(0.15, 9.0)
     mod_b = LFNoise2.kr(0.10 + (chaos * 0.9)).range(0.0, 1.0)
@@ -317,33 +320,32 @@ def patchlet(out=0, send_rev=0, send_del=0, amp=0.03, freq=110, life=6, chaos=0.
     sig = (sig * (1.6 + chaos)).tanh()
     LocalOut.ar([sig, sig])
     sig = Pan2.ar(sig, pan)
-    Out.ar(bus=out, source=sig * amp)
-    Out.ar(bus=send_rev, source=sig * amp * (0.35 + (chaos * 0.35)))
-    Out.ar(bus=send_del, source=sig * amp * (0.18 + (chaos * 0.25)))
+    write_out(out, sig, amp, amp * (0.35 + (chaos * 0.35)), amp * (0.18 + (chaos * 0.25)))
 
 
-def schedule_pattern(score, start, end, step, callback):
-    time = start
-    while time < end:
-        callback(time)
-        time += step
+def schedule_pattern(start, end, step, callback):
+    # Patterns run on an integer tick grid, so callbacks derive both times and
+    # beat indices from exact tick counts rather than from float division.
+    for tick in range(start, end, step):
+        callback(tick)
 
 
-def spawn_patch_cloud(score, group, mix_bus, rev_bus, del_bus, rng, time, count=64, base=110, chaos=0.6, life=7, amp=0.02):
+def spawn_patch_cloud(score, group, bus, rng, time, count=64, base=110, chaos=0.6, life=7, amp=0.02):
+    kwargs = dict(
+        add_action=AddAction.ADD_TO_HEAD,
+        target_node=group,
+        out=bus,
+    )
     for _ in range(count):
         freq = base * (2 ** rng.uniform(-1.0, 2.0))
         score.add_synth(
             patchlet,
-            add_action=AddAction.ADD_TO_HEAD,
-            target_node=group,
-            out=mix_bus,
-            send_rev=rev_bus,
-            send_del=del_bus,
             freq=freq,
             chaos=max(0.05, min(1.0, chaos * rng.uniform(0.6, 1.4))),
             life=max(0.3, min(18.0, life * rng.uniform(0.6, 1.4))),
             amp=max(0.0005, min(0.06, amp * rng.uniform(0.35, 1.2))),
             pan=rng.uniform(-1.0, 1.0),
+            **kwargs,
         )
 
 
@@ -354,8 +356,8 @@ def build_score(output_path: Path) -> tuple[Path | None, int]:
         maximum_node_count=32768,
         maximum_synthdef_count=2048,
     )
-    tempo = 132 / 60.0
-    beat = 1.0 / tempo
+    bpm = 132
+    ticks_per_second = bpm * TICKS_PER_BEAT / 60
     rng = random.Random(20240210)
 
     score = supriya.Score(options=options, output_bus_channel_count=2)
@@ -378,9 +380,11 @@ def build_score(output_path: Path) -> tuple[Path | None, int]:
             swarm,
             patchlet,
         )
-        mix_bus = score.add_bus_group(CalculationRate.AUDIO, 2)
-        rev_bus = score.add_bus_group(CalculationRate.AUDIO, 2)
-        del_bus = score.add_bus_group(CalculationRate.AUDIO, 2)
+        # Mix, reverb-send and delay-send stereo pairs, laid out contiguously
+        # so voices can write all three with a single Out.ar.
+        bus = score.add_bus_group(CalculationRate.AUDIO, 6)
+        mix_bus_id = int(bus)
+        rev_bus_id, del_bus_id = mix_bus_id + 2, mix_bus_id + 4
         g_main = score.add_group()
         g_patch = score.add_group(add_action=AddAction.ADD_AFTER, target_node=g_main)
         g_fx = score.add_group(add_action=AddAction.ADD_AFTER, target_node=g_patch)
@@ -389,8 +393,8 @@ def build_score(output_path: Path) -> tuple[Path | None, int]:
             reverb,
             add_action=AddAction.ADD_TO_TAIL,
             target_node=g_fx,
-            in_=int(rev_bus),
-            out=int(mix_bus),
+            in_=rev_bus_id,
+            out=mix_bus_id,
             mix=0.14,
             room=0.86,
             damp=0.42,
@@ -399,8 +403,8 @@ def build_score(output_path: Path) -> tuple[Path | None, int]:
             delay,
             add_action=AddAction.ADD_TO_TAIL,
             target_node=g_fx,
-            in_=int(del_bus),
-            out=int(mix_bus),
+            in_=del_bus_id,
+            out=mix_bus_id,
             time=0.33,
             decay=3.8,
             mix=0.18,
@@ -409,219 +413,183 @@ def build_score(output_path: Path) -> tuple[Path | None, int]:
             master_out,
             add_action=AddAction.ADD_TO_TAIL,
             target_node=g_master,
-            in_=int(mix_bus),
+            in_=mix_bus_id,
             out=0,
             gain=0.88,
         )
 
-    prog_roots = [57, 53, 60, 55]
-    arp_steps = [0, 7, 12, 7, 0, 3, 7, 10]
+    def to_tick(seconds: float) -> int:
+        return round(seconds * ticks_per_second)
+
+    def to_seconds(tick: int) -> float:
+        return tick / ticks_per_second
+
+    def beat_at(tick: int) -> int:
+        return tick // TICKS_PER_BEAT
 
     def prog_root_at(beat_index: int) -> float:
-        return prog_roots[(beat_index // 8) % len(prog_roots)]
+        return PROG_ROOTS[(beat_index // 8) % len(PROG_ROOTS)]
+
+    # Scheduled voices are collected first and then added with one moment per
+    # distinct tick, rather than one score.at() per event. Keying on ticks
+    # rather than seconds keeps voices scheduled from different section starts
+    # in the same moment.
+    events = []
+
+    def add_event(tick, voice, **kwargs):
+        events.append((tick, voice, kwargs))
+
+    def voice_kwargs(**kwargs):
+        # Arguments shared by every event a scheduler emits; callbacks only
+        # pass the arguments that vary per event.
+        return dict(
+            add_action=AddAction.ADD_TO_HEAD,
+            target_node=g_main,
+            out=mix_bus_id,
+            **kwargs,
+        )
 
     def schedule_pad(start, end):
-        def add_pad(time):
-            beat_index = int(time / beat)
+        kwargs = voice_kwargs(sustain=7.5, amp=0.06, bright=0.10, motion=0.35)
+
+        def add_pad(tick):
+            beat_index = beat_at(tick)
             freq = midi_to_hz(prog_root_at(beat_index))
-            score.add_synth(
-                pad,
-                add_action=AddAction.ADD_TO_HEAD,
-                target_node=g_main,
-                out=int(mix_bus),
-                send_rev=int(rev_bus),
-                send_del=int(del_bus),
-                freq=freq,
-                sustain=7.5,
-                amp=0.06,
-                bright=0.10,
-                motion=0.35,
-            )
+            add_event(tick, pad, freq=freq, **kwargs)
 
-        schedule_pattern(score, start, end, beat * 8, add_pad)
+        schedule_pattern(to_tick(start), to_tick(end), TICKS_PER_BEAT * 8, add_pad)
 
     def schedule_bass(start, end, amp=0.10, bright=0.10, drive=1.2):
-        def add_bass(time):
-            beat_index = int(time / beat)
-            step = arp_steps[beat_index % len(arp_steps)]
+        kwargs = voice_kwargs(sustain=0.10, amp=amp, bright=bright, drive=drive)
+
+        def add_bass(tick):
+            beat_index = beat_at(tick)
+            step = ARP_STEPS[beat_index % len(ARP_STEPS)]
             freq = midi_to_hz(prog_root_at(beat_index) + step)
-            score.add_synth(
-                bass,
-                add_action=AddAction.ADD_TO_HEAD,
-                target_node=g_main,
-                out=int(mix_bus),
-                send_rev=int(rev_bus),
-                send_del=int(del_bus),
-                freq=freq,
-                sustain=0.10,
-                amp=amp,
-                bright=bright,
-                drive=drive,
-            )
+            add_event(tick, bass, freq=freq, **kwargs)
 
-        schedule_pattern(score, start, end, beat / 4, add_bass)
+        schedule_pattern(to_tick(start), to_tick(end), TICKS_PER_BEAT // 4, add_bass)
 
     def schedule_kick(start, end, amp=0.62):
-        def add_kick(time):
-            score.add_synth(
-                kick,
-                add_action=AddAction.ADD_TO_HEAD,
-                target_node=g_main,
-                out=int(mix_bus),
-                send_rev=int(rev_bus),
-                send_del=int(del_bus),
-                amp=amp,
-            )
+        kwargs = voice_kwargs(amp=amp)
+
+        def add_kick(tick):
+            add_event(tick, kick, **kwargs)
 
-        schedule_pattern(score, start, end, beat, add_kick)
+        schedule_pattern(to_tick(start), to_tick(end), TICKS_PER_BEAT, add_kick)
 
     def schedule_snare(start, end, amp=0.36):
-        def add_snare(time):
-            if int(time / beat) % 2 == 1:
-                score.add_synth(
-                    snare,
-                    add_action=AddAction.ADD_TO_HEAD,
-                    target_node=g_main,
-                    out=int(mix_bus),
-                    send_rev=int(rev_bus),
-                    send_del=int(del_bus),
-                    amp=amp,
-                )
-
-        schedule_pattern(score, start, end, beat, add_snare)
+        kwargs = voice_kwargs(amp=amp)
+
+        def add_snare(tick):
+            add_event(tick, snare, **kwargs)
+
+        # Snares only land on odd beats, so start on the first odd beat at or
+        # after ``start`` and step over the even ones entirely.
+        first_beat = beat_at(to_tick(start) + TICKS_PER_BEAT - 1)
+        first_beat += 1 - (first_beat % 2)
+        schedule_pattern(
+            first_beat * TICKS_PER_BEAT, to_tick(end), TICKS_PER_BEAT * 2, add_snare
+        )
 
     def schedule_hat(start, end, amp=0.12):
-        def add_hat(time):
-            choice = rng.random()
-            hat_amp = 0.0
-            if choice > 0.75:
-                hat_amp = amp
-            elif choice > 0.25:
-                hat_amp = amp * 0.8
-            if hat_amp > 0:
-                score.add_synth(
-                    hat,
-                    add_action=AddAction.ADD_TO_HEAD,
-                    target_node=g_main,
-                    out=int(mix_bus),
-                    send_rev=int(rev_bus),
-                    send_del=int(del_bus),
-                    amp=hat_amp,
-                    bright=0.55,
-                )
-
-        schedule_pattern(score, start, end, beat / 4, add_hat)
+        kwargs = voice_kwargs(bright=0.55)
+
+        def add_hat(tick):
+            # Quarter chance of an accent, half of a ghost note, quarter rest.
+            choice = rng.getrandbits(2)
+            if choice == 3:
+                add_event(tick, hat, amp=amp, **kwargs)
+            elif choice:
+                add_event(tick, hat, amp=amp * 0.8, **kwargs)
+
+        schedule_pattern(to_tick(start), to_tick(end), TICKS_PER_BEAT // 4, add_hat)
 
     def schedule_pluck(start, end, amp=0.08):
-        def add_pluck(time):
-            beat_index = int(time / beat)
+        kwargs = voice_kwargs(amp=amp, bright=0.55)
+
+        def add_pluck(tick):
+            beat_index = beat_at(tick)
             root = prog_root_at(beat_index)
-            intervals = [0, 3, 7, 10, 12, 14]
-            freq = midi_to_hz(root + rng.choice(intervals))
-            score.add_synth(
+            freq = midi_to_hz(root + rng.choice(PLUCK_INTERVALS))
+            add_event(
+                tick,
                 pluck,
-                add_action=AddAction.ADD_TO_HEAD,
-                target_node=g_main,
-                out=int(mix_bus),
-                send_rev=int(rev_bus),
-                send_del=int(del_bus),
                 freq=freq,
                 sustain=rng.uniform(0.10, 0.35),
-                amp=amp,
-                bright=0.55,
+                **kwargs,
             )
 
-        schedule_pattern(score, start, end, beat / 2, add_pluck)
+        schedule_pattern(to_tick(start), to_tick(end), TICKS_PER_BEAT // 2, add_pluck)
 
     def schedule_lead(start, end, amp=0.11):
-        melody = [12, 15, 19, 17, 12, 10, 7, 10]
-
-        def add_lead(time):
-            beat_index = int(time / beat)
-            freq = midi_to_hz(prog_root_at(beat_index) + melody[beat_index % len(melody)])
-            score.add_synth(
-                lead,
-                add_action=AddAction.ADD_TO_HEAD,
-                target_node=g_main,
-                out=int(mix_bus),
-                send_rev=int(rev_bus),
-                send_del=int(del_bus),
-                freq=freq,
-                sustain=0.22,
-                amp=amp,
-                bright=0.85,
-                bite=0.55,
-            )
+        kwargs = voice_kwargs(sustain=0.22, amp=amp, bright=0.85, bite=0.55)
+
+        def add_lead(tick):
+            beat_index = beat_at(tick)
+            step = LEAD_MELODY[beat_index % len(LEAD_MELODY)]
+            freq = midi_to_hz(prog_root_at(beat_index) + step)
+            add_event(tick, lead, freq=freq, **kwargs)
 
-        schedule_pattern(score, start, end, beat / 2, add_lead)
+        schedule_pattern(to_tick(start), to_tick(end), TICKS_PER_BEAT // 2, add_lead)
 
     def schedule_glitch(start, end, amp=0.05):
-        def add_glitch(time):
-            score.add_synth(
+        kwargs = voice_kwargs()
+
+        def add_glitch(tick):
+            add_event(
+                tick,
                 glitch_hit,
-                add_action=AddAction.ADD_TO_HEAD,
-                target_node=g_main,
-                out=int(mix_bus),
-                send_rev=int(rev_bus),
-                send_del=int(del_bus),
                 freq=rng.uniform(300, 5200),
                 dur=rng.uniform(0.03, 0.11),
                 amp=rng.uniform(0.02, amp),
                 crush=rng.uniform(0.35, 0.85),
                 pan=rng.uniform(-0.9, 0.9),
+                **kwargs,
             )
 
-        schedule_pattern(score, start, end, beat / 2, add_glitch)
+        schedule_pattern(to_tick(start), to_tick(end), TICKS_PER_BEAT // 2, add_glitch)
 
     def schedule_modem(start, end, amp=0.06):
-        def add_modem(time):
-            score.add_synth(
+        kwargs = voice_kwargs()
+
+        def add_modem(tick):
+            add_event(
+                tick,
                 modem,
-                add_action=AddAction.ADD_TO_HEAD,
-                target_node=g_main,
-                out=int(mix_bus),
-                send_rev=int(rev_bus),
-                send_del=int(del_bus),
                 dur=rng.uniform(0.12, 0.7),
                 amp=rng.uniform(0.01, amp),
                 pan=rng.uniform(-0.7, 0.7),
+                **kwargs,
             )
 
-        schedule_pattern(score, start, end, beat * rng.choice([1, 2, 4]), add_modem)
+        step = TICKS_PER_BEAT * rng.choice([1, 2, 4])
+        schedule_pattern(to_tick(start), to_tick(end), step, add_modem)
 
     def schedule_riser(start, end, amp=0.10):
-        def add_riser(time):
-            score.add_synth(
-                riser,
-                add_action=AddAction.ADD_TO_HEAD,
-                target_node=g_main,
-                out=int(mix_bus),
-                send_rev=int(rev_bus),
-                send_del=int(del_bus),
-                amp=amp,
-                dur=rng.uniform(2.5, 5.5),
-            )
+        kwargs = voice_kwargs(amp=amp)
+
+        def add_riser(tick):
+            add_event(tick, riser, dur=rng.uniform(2.5, 5.5), **kwargs)
 
-        schedule_pattern(score, start, end, beat * 8, add_riser)
+        schedule_pattern(to_tick(start), to_tick(end), TICKS_PER_BEAT * 8, add_riser)
 
     def schedule_swarm(start, end, amp=0.075):
-        def add_swarm(time):
-            beat_index = int(time / beat)
+        kwargs = voice_kwargs(amp=amp)
+
+        def add_swarm(tick):
+            beat_index = beat_at(tick)
             freq = midi_to_hz(prog_root_at(beat_index) - 12)
-            score.add_synth(
+            add_event(
+                tick,
                 swarm,
-                add_action=AddAction.ADD_TO_HEAD,
-                target_node=g_main,
-                out=int(mix_bus),
-                send_rev=int(rev_bus),
-                send_del=int(del_bus),
                 base=freq,
                 life=rng.uniform(6, 14),
-                amp=amp,
                 chaos=rng.uniform(0.35, 0.95),
+                **kwargs,
             )
 
-        schedule_pattern(score, start, end, beat * 4, add_swarm)
+        schedule_pattern(to_tick(start), to_tick(end), TICKS_PER_BEAT * 4, add_swarm)
 
     # Timeline (seconds)
     intro_end = 30.0
@@ -645,13 +613,17 @@ def build_score(output_path: Path) -> tuple[Path | None, int]:
     schedule_lead(120.0, drop_end, amp=0.11)
     schedule_swarm(120.0, drop_end, amp=0.075)
 
+    events.sort(key=lambda event: event[0])
+    for tick, moment_events in itertools.groupby(events, key=lambda event: event[0]):
+        with score.at(to_seconds(tick)):
+            for _, voice, kwargs in moment_events:
+                score.add_synth(voice, **kwargs)
+
     with score.at(120.0):
         spawn_patch_cloud(
             score,
             g_patch,
-            int(mix_bus),
-            int(rev_bus),
-            int(del_bus),
+            mix_bus_id,
             rng,
             time=120.0,
             count=120,
@@ -666,17 +638,13 @@ def build_score(output_path: Path) -> tuple[Path | None, int]:
             crash,
             add_action=AddAction.ADD_TO_HEAD,
             target_node=g_main,
-            out=int(mix_bus),
-            send_rev=int(rev_bus),
-            send_del=int(del_bus),
+            out=mix_bus_id,
             amp=0.60,
         )
         spawn_patch_cloud(
             score,
             g_patch,
-            int(mix_bus),
-            int(rev_bus),
-            int(del_bus),
+            mix_bus_id,
             rng,
             time=150.0,
             count=60,
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 import supriya
 
 
@@ -24,3 +26,57 @@ def test_gatogen_anthem_build_score_uses_render(tmp_path, monkeypatch) -> None:
     assert output_path.parent.exists()
     assert called["output_file_path"] == output_path
     assert called["header_format"] == "wav"
+
+
+@pytest.fixture
+def gatogen():
+    # The cue's SynthDefs use UGens and call signatures this supriya doesn't
+    # provide (FreeVerb2, positional UGen arguments, .range/.linexp).
+    try:
+        import scripts.gatogen_anthem_01 as gatogen
+    except (AttributeError, ImportError, TypeError) as exception:
+        pytest.skip(f"gatogen SynthDefs don't build against this supriya: {exception}")
+    return gatogen
+
+
+def record_gatogen_synths(gatogen, tmp_path, monkeypatch):
+    added = []
+    add_synth = supriya.Score.add_synth
+
+    def record_add_synth(self, synthdef, **kwargs):
+        added.append((self._get_moment().seconds, synthdef, kwargs))
+        return add_synth(self, synthdef, **kwargs)
+
+    monkeypatch.setattr(supriya.Score, "add_synth", record_add_synth)
+    monkeypatch.setattr(
+        supriya, "render", lambda score, output_file_path, **_: (output_file_path, 0)
+    )
+
+    gatogen.build_score(tmp_path / "gatogen.wav")
+    return added
+
+
+def test_gatogen_anthem_bass_follows_beat_grid(gatogen, tmp_path, monkeypatch) -> None:
+    added = record_gatogen_synths(gatogen, tmp_path, monkeypatch)
+
+    bass = sorted(
+        (time, kwargs["freq"])
+        for time, synthdef, kwargs in added
+        if synthdef is gatogen.bass
+    )
+    assert len(bass) == 1584
+    # Step 228 sits on beat 57, which float division used to truncate to 56.
+    time, freq = bass[228]
+    assert time == pytest.approx(57 * 60 / 132)
+    assert freq == gatogen.midi_to_hz(gatogen.PROG_ROOTS[3] + gatogen.ARP_STEPS[1])
+
+
+def test_gatogen_anthem_snares_land_on_odd_beats(
+    gatogen, tmp_path, monkeypatch
+) -> None:
+    added = record_gatogen_synths(gatogen, tmp_path, monkeypatch)
+
+    beats = sorted(
+        time * 132 / 60 for time, synthdef, _ in added if synthdef is gatogen.snare
+    )
+    assert beats == pytest.approx(list(range(67, 330, 2)))